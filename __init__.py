@@ -3,7 +3,7 @@ from .class_decorators import *
 from .function_decorators import *
 
 # Classes
-from .hexbytes import hexbytes
+from .hexbytes import hexbytes, hexview
 
 # Submodules
 from .submodules import *
@@ -0,0 +1,40 @@
+"""
+Benchmark copies made by immutified hexbytes methods on large instances
+- copy.deepcopy() against the memcpy copier picked by immutify_methods
+- hexbytes.reverse() end to end, which copies then reverses
+
+Usage: python benchmarks/bench_copier.py [MiB ...]
+"""
+
+from pathlib import Path
+import copy
+import importlib
+import sys
+import timeit
+
+# Import the checkout as a package regardless of its directory name
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT.parent))
+package = importlib.import_module(ROOT.name)
+class_decorators = importlib.import_module(f'{ROOT.name}.class_decorators')
+
+
+def bench(stmt, number=5, repeat=5):
+    # Best of `repeat` in milliseconds per call
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number * 1e3
+
+
+def main(sizes):
+    copier = class_decorators._get_copier(package.hexbytes)
+    print(f"copier = {copier.__name__}")
+    print(f"{'MiB':>5} | {'deepcopy':>10} | {'copier':>10} | {'reverse()':>10}")
+    for size in sizes:
+        hb = package.hexbytes(bytes(range(256)) * (size << 12))
+        deep = bench(lambda: copy.deepcopy(hb))
+        fast = bench(lambda: copier(hb))
+        reverse = bench(lambda: hb.reverse())
+        print(f"{size:5d} | {deep:7.2f} ms | {fast:7.2f} ms | {reverse:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [1, 8, 64])
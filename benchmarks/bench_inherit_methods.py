@@ -0,0 +1,48 @@
+"""
+Benchmark hexbytes methods wrapped by inherit_methods against the same
+calls on a plain bytearray, to measure the per-call overhead of wrapping
+
+Usage: python benchmarks/bench_inherit_methods.py [number]
+"""
+
+from pathlib import Path
+import importlib
+import sys
+import timeit
+
+# Import the checkout as a package regardless of its directory name
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT.parent))
+package = importlib.import_module(ROOT.name)
+
+CASES = [
+    'x + other',
+    'x * 4',
+    "x.replace(b'a', b'z')",
+    "x.find(b'ba')",
+    "x.split(b'b')",
+    'len(x)',
+    'x == other',
+]
+
+
+def bench(stmt, x, other, number):
+    # Best of 15 in nanoseconds per call
+    times = timeit.repeat(stmt, globals={'x': x, 'other': other},
+        number=number, repeat=15)
+    return min(times) / number * 1e9
+
+
+def main(number):
+    hb = package.hexbytes(b'ab' * 32)
+    raw = bytearray(hb)
+    other = b'cd' * 8
+    for stmt in CASES:
+        base = bench(stmt, raw, other, number)
+        wrapped = bench(stmt, hb, other, number)
+        print(f"{stmt:24s} bytearray {base:7.0f} ns  "
+            f"hexbytes {wrapped:7.0f} ns  x{wrapped / base:.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,65 @@
+"""
+Benchmark objdump line parsers in lines per second
+- parse_objdump_line() on every instruction line
+- parse_objdump_line() then instruction.fromlist() on each result
+- parse_objdump_lines() batch parser
+
+Usage: python benchmarks/bench_parse_objdump.py binary [repeat]
+ex) python benchmarks/bench_parse_objdump.py /usr/bin/python3
+"""
+
+from pathlib import Path
+import importlib
+import subprocess
+import sys
+import time
+
+# Import the checkout as a package regardless of its directory name
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT.parent))
+ctftools = importlib.import_module(f'{ROOT.name}.submodules.ctftools')
+
+
+def parse_line(lines):
+    return [ctftools.parse_objdump_line(x) for x in lines if ":\t" in x]
+
+
+def parse_line_fromlist(lines):
+    fromlist = ctftools.instruction.fromlist
+    return [fromlist(ctftools.parse_objdump_line(x))
+        for x in lines if ":\t" in x]
+
+
+def parse_lines(lines):
+    return list(ctftools.parse_objdump_lines(lines))
+
+
+def bench(parser, lines, repeat):
+    # Best of `repeat` in lines per second
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser(lines)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+def main(exec_path, repeat):
+    dump = subprocess.run(['objdump', *ctftools._OBJDUMP_FLAGS, exec_path],
+        capture_output=True, check=True).stdout
+    lines = dump.decode().strip().split('\n')
+    print(f"{exec_path}: {len(lines)} lines, best of {repeat}")
+
+    parsers = [
+        ('parse_objdump_line', parse_line),
+        ('+ instruction.fromlist', parse_line_fromlist),
+        ('parse_objdump_lines', parse_lines),
+    ]
+    for name, parser in parsers:
+        print(f"{name:24s} {bench(parser, lines, repeat) / 1e3:8.0f}k lines/s")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit(__doc__.strip())
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -0,0 +1,69 @@
+"""
+Benchmark ctftools.exec() spawn latency as the parent's RSS grows
+- posix_spawn against subprocess.Popen with and without vfork
+- Each with and without a timeout
+
+Usage: python benchmarks/bench_spawn.py [RSS MiB ...]
+"""
+
+from pathlib import Path
+import importlib
+import subprocess
+import sys
+import time
+
+# Import the checkout as a package regardless of its directory name
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT.parent))
+ctftools = importlib.import_module(f'{ROOT.name}.submodules.ctftools')
+
+# (label, use posix_spawn, let Popen use vfork)
+MODES = [
+    ('posix_spawn', True, True),
+    ('Popen vfork', False, True),
+    ('Popen fork', False, False),
+]
+
+# Touched buffers keeping the parent's RSS up
+heap = []
+
+
+def rss():
+    # Resident set size of this process in MiB
+    with open('/proc/self/statm') as file:
+        pages = int(file.read().split()[1])
+    return pages * 4096 >> 20
+
+
+def grow(target):
+    while rss() < target:
+        buffer = bytearray(64 << 20)
+        buffer[::4096] = b'\1' * len(range(0, len(buffer), 4096))
+        heap.append(buffer)
+
+
+def bench(number, **kwargs):
+    # Mean milliseconds per exec() after a warm up run
+    ctftools.exec(['true'], shell=False, **kwargs)
+    start = time.perf_counter()
+    for _ in range(number):
+        ctftools.exec(['true'], shell=False, **kwargs)
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def main(targets, number=100):
+    print("RSS MiB | " + " | ".join(f"{x:>18s}" for x, _, _ in MODES)
+        + "   [plain / timeout=10]")
+    for target in targets:
+        grow(target)
+        row = []
+        for _, posix_spawn, vfork in MODES:
+            ctftools._POSIX_SPAWN = posix_spawn
+            subprocess._USE_VFORK = vfork
+            row.append(f"{bench(number):6.2f} / "
+                f"{bench(number, timeout=10):6.2f} ms")
+        print(f"{rss():7d} | " + " | ".join(row))
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [0, 512, 2048])
@@ -47,7 +47,7 @@ def _is_inherited(cls, attr):
 _object_methods = tuple(_get_methods(object))
 
 default_ignores = ('__delitem__', '__getitem__', '__setitem__',
-                    '__del__', '__new__', '__init__'
+                    '__del__', '__new__', '__init__',
                     '__len__', '__alloc__', '__contains__',
                     '__repr__', '__str__', '__iter__')
 
@@ -77,25 +77,44 @@ def inherit_methods(cls, *, ignore=default_ignores, ignore_obj=True):
     if not helper.seq_holdstype(ignore, str):
         raise TypeError(f"Argument must be a sequence of str: {ignore}")
 
+    # Result type -> converter to child class, False to return as is
+    # - Resolved on first sight of each type and shared by all wrappers
+    converters = {}
+
+    def convert_sequence(seq):
+        # Elements are converted but not searched any further
+        for item_type in set(map(type, seq)).difference(converters):
+            resolve(item_type)
+        return type(seq) ([cls(x) if converters[type(x)] is cls else x
+            for x in seq])
+
+    def resolve(result_type):
+        if result_type is cls:
+            # Already a fresh child class instance
+            convert = False
+        elif issubclass(cls, result_type):
+            # Result is instance of parent class
+            convert = cls
+        elif issubclass(result_type, (list, tuple, set, frozenset)):
+            convert = convert_sequence
+        else:
+            convert = False
+        converters[result_type] = convert
+        return convert
+
     def apply_wrapper(cls, func_name):
         super_method = getattr(super(cls, cls), func_name)
 
-        def issuperclass(obj, cls):
-            return issubclass(cls, type(obj))
-
         @functools.wraps(super_method)
         def wrapped_func(self, *args, **kwargs):
-            result = super_method(self, *args, **kwargs)
+            # Calls without keywords skip building a keyword dict
+            result = super_method(self, *args, **kwargs) if kwargs \
+                else super_method(self, *args)
             # Convert to child class if applicable, otherwise return as is
-            if issuperclass(result, cls):
-                # Result is instance of parent class
-                return cls(result)
-            elif helper.seq_holdstype(result):
-                gen = (cls(x) if issuperclass(x, cls) else x for x in result)
-                return type(result) (gen)
-            else:
-                # Default
-                return result
+            convert = converters.get(type(result))
+            if convert is None:
+                convert = resolve(type(result))
+            return convert(result) if convert else result
 
         # Update __qualname__ to reflect current class name
         wrapped_func.__qualname__ = f"{cls.__name__}.{func_name}"
@@ -114,8 +133,42 @@ def inherit_methods(cls, *, ignore=default_ignores, ignore_obj=True):
     return cls
 
 
+def _copy_buffer(obj):
+    """
+    Copy flat buffer `obj` with a single memcpy of its data
+    and a deepcopy of its instance attributes only if there are any
+    """
+    copy_obj = bytearray.__new__(type(obj))
+    bytearray.__init__(copy_obj, obj)
+
+    state = getattr(obj, '__dict__', None)
+    if state:
+        copy_obj.__dict__.update(copy.deepcopy(state))
+    return copy_obj
+
+
+def _get_copier(cls):
+    """
+    Pick the cheapest way to copy instances of `cls` equivalent to deepcopy
+    - bytearray subclasses: _copy_buffer()
+    - Otherwise or if copying is customized: copy.deepcopy()
+    """
+    if not issubclass(cls, bytearray):
+        return copy.deepcopy
+    # Slot values live outside __dict__ and would be lost
+    if any('__slots__' in vars(x) for x in cls.__mro__):
+        return copy.deepcopy
+
+    customized = ('__copy__', '__deepcopy__', '__reduce__', '__reduce_ex__',
+        '__getstate__', '__setstate__')
+    if any(getattr(cls, x, None) is not getattr(bytearray, x, None)
+        for x in customized):
+        return copy.deepcopy
+    return _copy_buffer
+
+
 @decorator_varargs
-def immutify_methods(cls, methods):
+def immutify_methods(cls, methods, *, copier=None, cow=False):
     """
     Class decorator that re-defines instance methods to execute on a
     new deepcopy and return the copy object
@@ -127,18 +180,35 @@ def immutify_methods(cls, methods):
         * sequence type = list, tuple, set, frozenset
         * These functions are candidate for wrapping
         * @staticmethod and @classmethod are always ignored
+    - copier: callable taking an instance and returning its copy (keyword only)
+        * Default = memcpy for bytearray subclasses without custom
+          copy behavior, copy.deepcopy otherwise
+    - cow: boolean (keyword only)
+        * If true, use copy.copy() of the class as copier, which must
+          share storage and copy it on the first write of either side
+          ex) hexview: hv.reverse().reverse() copies no bytes
+        * Cannot be used with copier
+        * Default = False
     """
     if not inspect.isclass(cls):
         raise TypeError(f"Must be used on a class, not: {type(cls)}")
     if not helper.seq_holdstype(methods, str):
         raise TypeError(f"Argument must be a sequence of str: {methods}")
+    if cow:
+        if copier is not None:
+            raise TypeError("Cannot use copier with cow=True")
+        copier = copy.copy
+    elif copier is None:
+        copier = _get_copier(cls)
+    elif not callable(copier):
+        raise TypeError(f"Argument must be callable: {copier}")
 
     def apply_wrapper(cls, func_name):
         func = getattr(cls, func_name)
 
         @functools.wraps(func)
         def wrapped_func(self, *args, **kwargs):
-            copy_obj = copy.deepcopy(self)
+            copy_obj = copier(self)
             res = func(copy_obj, *args, **kwargs)
             if res is not None:
                 # Replace this with warning
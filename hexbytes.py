@@ -16,13 +16,30 @@ class hexbytes(bytearray):
     def __getitem__(self, key):
         """
         Return child class instance when slicing
+        - Use view() to slice without copying
         """
         if isinstance(key, slice):
-            return type(self) (super().__getitem__(key))
+            # Copy once out of a memoryview instead of an interim bytearray
+            with memoryview(self) as view:
+                return type(self) (view[key])
 
         return super().__getitem__(key)
 
 
+    def view(self, start=0, stop=None):
+        """
+        Get `hexview` of self[start:stop] sharing memory with self
+        """
+        return hexview(self, start, stop)
+
+
+    def window(self, start, size):
+        """
+        Get `hexview` of `size` bytes from `start` sharing memory with self
+        """
+        return hexview(self, start, start + size)
+
+
     @classmethod
     def ishexbyte(cls, hex_str):
         """
@@ -135,4 +152,162 @@ class hexbytes(bytearray):
         return self.__padhex(width, fill_hex, pad_left=False, sign_ext=False)
 
 
+
+@immutify_methods({'reverse'}, cow=True)
+class hexview:
+    """
+    View into the memory of a `hexbytes` object like a slice of it
+    - Reading and slicing never copy data
+    - Mutation copies the viewed bytes first, so the viewed object
+      is never changed through a view
+    - reverse() returns a reversed view of the same memory,
+      ex) hb.view().reverse().reverse() copies no bytes
+    - The viewed object cannot be resized while the view is alive,
+      use release() or a with block to let go of it early
+    """
+
+    def __init__(self, data=b'', start=0, stop=None):
+        with memoryview(data) as view:
+            if view.format != 'B':
+                view = view.cast('B')
+            # Slice of a released view stays valid
+            self._data = view[start:stop]
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+    def __copy__(self):
+        """
+        New view of the same bytes, both copy them on their first write
+        """
+        if not isinstance(self._data, memoryview):
+            # Share bytes copied by an earlier write, so they are copied
+            # again before either view writes to them
+            self._data = memoryview(self._data)
+        return hexview(self._data)
+
+
+    def reverse(self):
+        """
+        Reverse order of viewed bytes without copying them
+        """
+        if isinstance(self._data, memoryview):
+            data = self._data
+            self._data = data[::-1]
+            data.release()
+        else:
+            bytearray.reverse(self._data)
+
+
+    def release(self):
+        """
+        Release memory of the viewed object
+        """
+        if isinstance(self._data, memoryview):
+            self._data.release()
+
+
+    def materialize(self):
+        """
+        Copy viewed bytes into a new `hexbytes`
+        """
+        return hexbytes(self._data)
+
+
+    def __len__(self):
+        return len(self._data)
+
+
+    def __iter__(self):
+        return iter(self._data)
+
+
+    def __bytes__(self):
+        return bytes(self._data)
+
+
+    def __eq__(self, other):
+        if isinstance(other, hexview):
+            other = other._data
+        try:
+            return memoryview(self._data) == other
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+
+    def __getitem__(self, key):
+        """
+        Return view of the same memory when slicing
+        """
+        if isinstance(key, slice):
+            return hexview(self._data, key.start, key.stop) if key.step is None \
+                else hexview(memoryview(self._data)[key])
+
+        return self._data[key]
+
+
+    def __setitem__(self, key, value):
+        """
+        Copy viewed bytes before the first mutation
+        """
+        if isinstance(self._data, memoryview):
+            data = hexbytes(self._data)
+            self._data.release()
+            self._data = data
+
+        self._data[key] = value
+
+
+    def __repr__(self):
+        return f"{type(self).__name__}({bytes(self._data)!r})"
+
+
+    def __str__(self):
+        """
+        List-like string representation with "0x" prefix like `hexbytes`
+        """
+        return f"0x [{self.hex('/')}]".replace('/', ", ")
+
+
+    def hex(self, *args):
+        return self._data.hex(*args)
+
+
+    def get(self, index):
+        """
+        Get byte value as hexbyte string
+        """
+        return format(self._data[index], '02x')
+
+
+    def set(self, index, hex_str):
+        """
+        Set byte value from hexbyte string
+        """
+        hexbytes.enforcehexbyte(hex_str)
+
+        self[index] = int(hex_str, 16)
+
+
+    def lpad(self, *args, **kwargs):
+        """
+        Padded copy like `hexbytes.lpad()`
+        """
+        return self.materialize().lpad(*args, **kwargs)
+
+
+    def rpad(self, *args, **kwargs):
+        """
+        Padded copy like `hexbytes.rpad()`
+        """
+        return self.materialize().rpad(*args, **kwargs)
+
 __all__ = [x for x in globals() if x not in __exclude__ and not x.startswith('_')]
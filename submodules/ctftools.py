@@ -2,109 +2,1190 @@
 Module docstring
 """
 
-from subprocess import run
+from subprocess import run, Popen, PIPE, DEVNULL
 from pathlib import Path
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pty import openpty
+from array import array
+from bisect import bisect_left
+import asyncio
+import codecs
+import contextlib
+import errno
+import fnmatch
+import fcntl
+import functools
+import hashlib
+import mmap
 import os
+import pickle
+import re
+import queue
+import selectors
 import shlex
+import signal
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+import warnings
+import zlib
 
 from . import helper
 
 __exclude__ = list(globals())
 
+# Bounds of adaptive read size for pseudo tty output
+_READ_MIN = 1 << 12
+_READ_MAX = 1 << 20
+
+# Maximum size of a single non-blocking write to stdin
+_PIPE_CHUNK = 1 << 16
+
+# Result of a single command run by exec_many() or exec(rusage=True)
+# - reason is None unless the run was stopped by a limit (see ExecAborted)
+# - usage is None unless resource usage was requested
+exec_result = namedtuple('exec_result',
+    ['output', 'returncode', 'elapsed', 'reason', 'usage'],
+    defaults=[None, None])
+
+# Resource usage of a single run, reported by os.wait4()
+# - cpu_user, cpu_system: CPU time in seconds
+# - max_rss: peak resident set size in bytes
+#   * Linux carries the peak over exec, so it is never below the RSS
+#     this process had when spawning
+# - output_bytes: console output size before decoding
+exec_usage = namedtuple('exec_usage',
+    ['cpu_user', 'cpu_system', 'max_rss', 'output_bytes'])
+
+# ru_maxrss is in KiB except on macOS
+_RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
 
 def exec_shell(cmd):
     """
-    Deprecated function to run shell commands
+    Deprecated function to run shell commands, use exec() or capture()
 
     Uses subprocess module's internal PIPE to capture outputs
     - Captured outputs may be out of order compared to executing in a tty
     """
-    print("[Deprecated] ctftools: Switch from exec_shell() to exec()")
-    return run(cmd, capture_output=True, shell=True).stdout.decode().strip()
+    warnings.warn("ctftools: Switch from exec_shell() to exec() or capture()",
+        DeprecationWarning, stacklevel=2)
+    return capture(cmd, shell=True).decode().strip()
+
 
+def _capture_args(cmd, shell):
+    if shell is None:
+        shell = isinstance(cmd, str)
+    if shell:
+        return (cmd if isinstance(cmd, str) else ' '.join(cmd)), True
+    return (shlex.split(cmd) if isinstance(cmd, str) else list(cmd)), False
 
-def exec(cmd, *, binput=None):
+
+def capture(cmd, *, shell=None, view=False):
     """
-    Execute `cmd` in a shell using a pseudo tty
-    Returns result as (console output, return code)
+    Run `cmd` and capture its stdout through a pipe without decoding
 
-    - If supplied, binput is byte data passed to the stdin
+    - cmd: str or sequence of str
+    - shell: same as exec()
+    - view: boolean
+        * If true, return memoryview of the output instead of bytes
+    - stderr is discarded, so unlike exec() nothing is reordered or mixed
+    """
+    args, shell = _capture_args(cmd, shell)
+    output = run(args, shell=shell, stdout=PIPE, stderr=DEVNULL).stdout
+    return memoryview(output) if view else output
 
-    Reference
-    - https://bugs.python.org/issue5380
+
+def capture_lines(cmd, *, shell=None):
+    """
+    Generator yielding stdout lines of `cmd` as bytes while it runs
+
+    - Same as capture() but lines are never held all at once
+    - Lines keep their trailing b'\\n'
+    - Closing the generator early kills `cmd`
     """
+    args, shell = _capture_args(cmd, shell)
+    proc = Popen(args, shell=shell, stdout=PIPE, stderr=DEVNULL)
+    try:
+        yield from proc.stdout
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+
+def _check_binput(binput):
     if binput is not None and not isinstance(binput, (bytes, bytearray)):
         raise TypeError("Argument must be a byte-like object: {binput}")
 
-    # Parse file descriptor redirection
-    parsed_cmd = shlex.split(cmd)
+
+def _open_redirects(parsed_cmd):
+    """
+    Open files for explicit file descriptor redirection in `parsed_cmd`
+    tokens (ex. `3< file` or `3<file`)
+    Returns (remaining tokens, list of (desired fd, opened fd))
+
+    - Files stay on whichever fd the OS picked, moving them to the desired
+      fd is left to the child (see _posix_spawn())
+    """
+    argv = []
     redirects = []
-    for i, token in enumerate(parsed_cmd):
+    tokens = iter(parsed_cmd)
+    for token in tokens:
         if '<' in token and not token.startswith('<'):
+            fd_str, path = token.split('<', 1)
+            if not path:
+                path = next(tokens, '')
             try:
                 # Extract desired fd
-                fd_r = int(token.split('<')[0])
+                fd_r = int(fd_str)
 
                 # Will not attempt to open using STD I/O file descriptors
                 if fd_r < 3:
                     raise ValueError
 
-                # Open file
-                file = open(parsed_cmd[i + 1])
-
-                # Change fd to desired value
-                if fd_r != file.fileno():
-                    os.dup2(file.fileno(), fd_r)
-                    file.close()
+                # Open file without a file object closing it on collection
+                fd_file = os.open(path, os.O_RDONLY)
 
                 # Add fd to list
-                redirects.append(fd_r)
+                redirects.append((fd_r, fd_file))
             except ValueError:
                 err_msg = "Will not explicitly redirect file to STD I/O"
                 raise ValueError(err_msg) from None
             except Exception as err:
                 err_msg = "Failed to handle file descriptor redirection"
-                err_tokens = (token, parsed_cmd[i + 1])
+                err_tokens = (token, path)
                 raise ValueError(f"{err_msg}: {err_tokens}") from err
+        else:
+            argv.append(token)
+
+    # An opened fd must not be a desired fd, or moving another file there
+    # in the child would close it early (or keep it close-on-exec)
+    desired = {fd_r for fd_r, _ in redirects}
+    for i, (fd_r, fd_file) in enumerate(redirects):
+        if fd_file in desired:
+            fd_high = fcntl.fcntl(fd_file, fcntl.F_DUPFD_CLOEXEC,
+                max(desired) + 1)
+            os.close(fd_file)
+            redirects[i] = (fd_r, fd_high)
+    return argv, redirects
+
+
+# Start children through os.posix_spawnp() rather than Popen
+# - Spawn cost stays flat however large this process grows
+# - Sessions fall back to Popen for good the first time the platform
+#   cannot start one through posix_spawnp()
+_POSIX_SPAWN = hasattr(os, 'posix_spawnp')
+_POSIX_SPAWN_SESSION = True
+
+# Directory listing open file descriptors of this process
+_FD_DIR = '/proc/self/fd' if os.path.isdir('/proc/self/fd') else '/dev/fd'
+
+# Signals Python ignores that the child should get default handling for,
+# like Popen(restore_signals=True)
+_SPAWN_SIGDEF = tuple(getattr(signal, x)
+    for x in ('SIGPIPE', 'SIGXFZ', 'SIGXFSZ') if hasattr(signal, x))
+
+
+class _spawned:
+    """
+    Popen stand-in for a process started by _posix_spawn()
+    providing the subset of Popen used in this module
+    """
+
+    def __init__(self, pid, stdin):
+        self.pid = pid
+        self.stdin = stdin
+        self.stdout = None
+        self.returncode = None
+
+
+    def poll(self):
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+
+    def wait(self):
+        if self.returncode is None:
+            _, status = os.waitpid(self.pid, 0)
+            self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+
+    def kill(self):
+        if self.returncode is None:
+            os.kill(self.pid, signal.SIGKILL)
+
+
+def _inheritable_fds():
+    """
+    Get inheritable file descriptors of this process above standard I/O
+    Raises NotImplementedError if open file descriptors cannot be listed
+    """
+    try:
+        names = os.listdir(_FD_DIR)
+    except OSError:
+        raise NotImplementedError(f"Cannot list {_FD_DIR}") from None
+
+    fds = []
+    for fd in map(int, names):
+        try:
+            if fd > 2 and os.get_inheritable(fd):
+                fds.append(fd)
+        except OSError:
+            # Closed since, such as the fd of the listing itself
+            pass
+    return fds
+
+
+def _posix_spawn(argv, stdin, fd_c, redirects, session):
+    """
+    Start `argv` with os.posix_spawnp() moving `redirects` to their
+    desired fd through file actions in the child, so that the fd table
+    of this process is never touched and threads can spawn concurrently
+    Returns _spawned object
+
+    Other inheritable file descriptors are closed in the child
+    like Popen(close_fds=True)
+
+    - stdin: boolean
+        * If true, attach a pipe to stdin like Popen(stdin=PIPE)
+    - fd_c: pty slave to attach stdout and stderr to
+    """
+    targets = {fd_r for fd_r, _ in redirects}
+    closes = [(os.POSIX_SPAWN_CLOSE, fd)
+        for fd in _inheritable_fds() if fd not in targets]
+
+    fd_in = None
+    if stdin:
+        fd_in, fd_w = os.pipe()
+    try:
+        # Sources are never inheritable, so closing first spares them
+        # Standard I/O next, a desired fd may reuse the number of fd_c
+        actions = closes + [(os.POSIX_SPAWN_DUP2, fd_c, 1),
+            (os.POSIX_SPAWN_DUP2, fd_c, 2)]
+        if fd_in is not None:
+            actions.insert(len(closes), (os.POSIX_SPAWN_DUP2, fd_in, 0))
+        actions += [(os.POSIX_SPAWN_DUP2, fd_file, fd_r)
+            for fd_r, fd_file in redirects]
+        pid = os.posix_spawnp(argv[0], argv, os.environ,
+            file_actions=actions, setsigdef=_SPAWN_SIGDEF, setsid=session)
+    except BaseException:
+        if fd_in is not None:
+            os.close(fd_w)
+        raise
+    finally:
+        if fd_in is not None:
+            os.close(fd_in)
+
+    return _spawned(pid, os.fdopen(fd_w, 'wb') if stdin else None)
+
+
+def _spawn(cmd, binput, *, shell=None, session=False):
+    """
+    Start `cmd` with stdout and stderr attached to a pseudo tty
+    Returns (Popen or _spawned object, pty master file descriptor)
+
+    - cmd: str or sequence of str
+    - shell: boolean
+        * If true, run `cmd` through /bin/sh (sequence is joined by spaces)
+        * Otherwise execute the parsed argv directly
+        * Default = True for str, False for sequence
+    - If session == True, start in a new session so that the whole
+      process group can be killed through the pid of the shell
+    """
+    _check_binput(binput)
+    if shell is None:
+        shell = isinstance(cmd, str)
+
+    parsed_cmd = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+    argv, redirects = _open_redirects(parsed_cmd)
+    if shell:
+        # The shell redirects by itself inside the child, files were only
+        # opened to report errors the same way in both modes
+        for _, fd_file in redirects:
+            os.close(fd_file)
+        redirects = []
+        args = cmd if isinstance(cmd, str) else ' '.join(cmd)
+    elif argv:
+        args = argv
+    else:
+        for _, fd_file in redirects:
+            os.close(fd_file)
+        raise ValueError(f"No executable to run: {cmd}")
 
-    # Execute in a pseudo tty
+    global _POSIX_SPAWN_SESSION
     fd_p, fd_c = openpty()
-    res = run(cmd, input=binput, shell=True, stdout=fd_c, stderr=fd_c, pass_fds=redirects)
-    os.close(fd_c)
+    try:
+        proc = None
+        if _POSIX_SPAWN and (_POSIX_SPAWN_SESSION or not session) \
+            or redirects:
+            argv = ['/bin/sh', '-c', args] if shell else args
+            try:
+                proc = _posix_spawn(argv, binput is not None, fd_c, redirects,
+                    session)
+            except NotImplementedError:
+                # Platform lacks setsid or a way to list open fds,
+                # plain spawns keep using posix_spawnp() after a session
+                if redirects:
+                    raise
+                if session:
+                    _POSIX_SPAWN_SESSION = False
+        if proc is None:
+            stdin = PIPE if binput is not None else None
+            proc = Popen(args, shell=shell, stdin=stdin, stdout=fd_c,
+                stderr=fd_c, start_new_session=session)
+    except BaseException:
+        os.close(fd_p)
+        raise
+    finally:
+        # Child process holds its own copies from here on
+        os.close(fd_c)
+        for _, fd_file in redirects:
+            os.close(fd_file)
 
-    # Close redirected file descriptors
-    for fd_r in redirects:
-        os.close(fd_r)
+    return proc, fd_p
 
-    # Collect shell output
-    output = b''
+
+def _read_pty(fd_p, size):
+    """
+    Read up to `size` bytes from pty master `fd_p`
+    Returns b'' after every slave end has been closed
+    """
     try:
-        last_read = None
-        while last_read is None or len(last_read) > 0:
-            last_read = os.read(fd_p, 1024)
-            output += last_read
+        return os.read(fd_p, size)
     except OSError as err:
         # Reading from pty may throw OSError: [Errno 5] Input/output error
         # on excess reading instead of returning empty string after closing
-        # its pair on some platforms (see reference link for more info)
-        if err.strerror != "Input/output error":
+        # its pair on some platforms (see reference link in exec())
+        if err.errno != errno.EIO:
             raise err from None
+        return b''
+
+
+def _pty_chunks(proc, fd_p, binput, *, deadline=None, max_output=None):
+    """
+    Generator yielding raw chunks read from pty master `fd_p` until EOF
+    while feeding `binput` to the stdin of `proc` without blocking
+
+    - Read size doubles while reads fill it to cut down on syscalls
+    - Stops early once time.monotonic() passes `deadline` or more than
+      `max_output` bytes were read, in which case the generator returns
+      the reason ('timeout' or 'max_output') and output is cut at the cap
+    """
+    pending = memoryview(binput) if binput is not None else None
+    read_size = _READ_MIN
+    total = 0
+
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd_p, selectors.EVENT_READ)
+        if pending is not None:
+            stdin_fd = proc.stdin.fileno()
+            os.set_blocking(stdin_fd, False)
+            sel.register(stdin_fd, selectors.EVENT_WRITE)
+
+        try:
+            while True:
+                if pending is not None and len(pending) == 0:
+                    # Signal EOF on stdin once everything is written
+                    sel.unregister(stdin_fd)
+                    proc.stdin.close()
+                    pending = None
+
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        return 'timeout'
+
+                for key, _ in sel.select(timeout):
+                    if key.fd != fd_p:
+                        try:
+                            written = os.write(stdin_fd, pending[:_PIPE_CHUNK])
+                            pending = pending[written:]
+                        except BlockingIOError:
+                            pass
+                        except BrokenPipeError:
+                            # Child does not read stdin anymore
+                            pending = pending[:0]
+                        continue
+
+                    chunk = _read_pty(fd_p, read_size)
+                    if not chunk:
+                        return
+                    if len(chunk) == read_size and read_size < _READ_MAX:
+                        read_size <<= 1
+
+                    total += len(chunk)
+                    if max_output is not None and total > max_output:
+                        yield chunk[:len(chunk) - (total - max_output)]
+                        return 'max_output'
+                    yield chunk
+        finally:
+            if proc.stdin is not None and not proc.stdin.closed:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+
+def _decode_lines(chunks):
+    """
+    Generator yielding decoded lines without line terminators from `chunks`
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    # Pieces of the unfinished line, joined once it is complete so that
+    # long lines are not copied again on every read
+    pending = []
+    for chunk in chunks:
+        *lines, rest = decoder.decode(chunk).split('\n')
+        if lines:
+            pending.append(lines[0])
+            lines[0] = ''.join(pending)
+            pending = []
+            for line in lines:
+                yield line.rstrip('\r')
+        if rest:
+            pending.append(rest)
+
+    pending.append(decoder.decode(b'', final=True))
+    buffer = ''.join(pending)
+    if buffer:
+        yield buffer.rstrip('\r')
+
+
+def _drain_pty(fd_p, size):
+    """
+    Read at most `size` bytes already buffered in pty master `fd_p`
+    without waiting for more output
+    """
+    chunks = []
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd_p, selectors.EVENT_READ)
+        while size > 0 and sel.select(0):
+            chunk = _read_pty(fd_p, min(size, _READ_MAX))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+    return b''.join(chunks)
+
+
+class ExecAborted(RuntimeError):
+    """
+    Raised by exec() when a run is stopped by `timeout` or `max_output`
+
+    Attributes
+    - reason: 'timeout' or 'max_output'
+    - output: console output captured until the process was killed
+    - returncode: return code of the killed shell
+    - usage: exec_usage of the killed shell, or None if unavailable
+    """
+
+    def __init__(self, reason, output, returncode, usage=None):
+        super().__init__(f"Process stopped by {reason}: {returncode}")
+        self.reason = reason
+        self.output = output
+        self.returncode = returncode
+        self.usage = usage
+
+
+def exec(cmd, *, binput=None, shell=None, timeout=None, max_output=None,
+    rusage=False):
+    """
+    Execute `cmd` in a shell using a pseudo tty
+    Returns result as (console output, return code)
+
+    - If supplied, binput is byte data passed to the stdin
+    - shell: boolean
+        * If false, execute the binary directly without /bin/sh
+          and handle `N< file` redirections here
+        * Default = True for str `cmd`, False for a list of arguments
+    - Output is collected in chunks and joined once at the end
+    - If supplied, timeout is the limit of wall time in seconds
+    - If supplied, max_output is the limit of console output in bytes
+        * When a limit is hit, the whole process group is killed and
+          ExecAborted is raised with the output captured up to the cap
+    - rusage: boolean
+        * If true, return exec_result(output, returncode, elapsed,
+          None, exec_usage) where elapsed is the wall time in seconds
+        * Usage covers the process and every descendant it waited for
+
+    Reference
+    - https://bugs.python.org/issue5380
+    """
+    start = time.perf_counter()
+    limited = timeout is not None or max_output is not None
+    proc, fd_p = _spawn(cmd, binput, shell=shell, session=limited)
+    output, returncode, usage = _communicate(proc, fd_p, binput, timeout,
+        max_output)
+    if rusage:
+        return exec_result(output, returncode, time.perf_counter() - start,
+            None, usage)
+    return output, returncode
+
+
+def _wait(proc, output_bytes):
+    """
+    Reap `proc` like proc.wait() but through os.wait4()
+    Returns exec_usage, or None if `proc` was already reaped
+    """
+    if proc.returncode is not None:
+        return None
+    try:
+        _, status, usage = os.wait4(proc.pid, 0)
+    except ChildProcessError:
+        proc.wait()
+        return None
+
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return exec_usage(usage.ru_utime, usage.ru_stime,
+        usage.ru_maxrss * _RSS_UNIT, output_bytes)
+
+
+def _communicate(proc, fd_p, binput, timeout, max_output):
+    """
+    Feed `binput` and collect output of a process started by _spawn()
+    Returns (console output, return code, exec_usage)
+
+    - Closes `fd_p` and waits for `proc`
+    - `proc` must run in its own session if a limit is supplied
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        chunks = _pty_chunks(proc, fd_p, binput,
+            deadline=deadline, max_output=max_output)
+        output = []
+        try:
+            while True:
+                output.append(next(chunks))
+        except StopIteration as stop:
+            reason = stop.value
+
+        if reason is not None:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+            if reason == 'timeout':
+                # Keep output that arrived before the kill, up to the cap
+                size = _READ_MAX if max_output is None \
+                    else max_output - sum(map(len, output))
+                output.append(_drain_pty(fd_p, size))
+    except BaseException:
+        proc.kill()
+        os.close(fd_p)
+        proc.wait()
+        raise
+
+    os.close(fd_p)
+    output = b''.join(output)
+    usage = _wait(proc, len(output))
+    if reason is not None:
+        # Output may be cut in the middle of a multi-byte character
+        output = output.decode(errors='replace').strip()
+        raise ExecAborted(reason, output, proc.returncode, usage)
+
+    return output.decode().strip(), proc.returncode, usage
+
+
+def exec_stream(cmd, *, binput=None, shell=None, raw=False):
+    """
+    Execute `cmd` in a shell using a pseudo tty like exec()
+    but yield console output as soon as it arrives
+
+    - If supplied, binput is byte data passed to the stdin
+    - shell: same as exec()
+    - raw: boolean
+        * If true, yield byte chunks as read from the pseudo tty
+        * Otherwise yield decoded lines without line terminators
+    - Return code is the return value of the generator (StopIteration.value)
+    - Closing the generator early kills the process
+
+    ex) for line in exec_stream("./chall"): ...
+    """
+    proc, fd_p = _spawn(cmd, binput, shell=shell)
+    try:
+        chunks = _pty_chunks(proc, fd_p, binput)
+        yield from (chunks if raw else _decode_lines(chunks))
+    except BaseException:
+        proc.kill()
+        raise
     finally:
         os.close(fd_p)
+        proc.wait()
+
+    return proc.returncode
+
+
+class tube:
+    """
+    Long-lived process in a shell using a pseudo tty like exec()
+    for multi-stage interaction with the same process
+
+    - shell: same as exec()
+    - Output is read through a selector into an internal buffer
+    - recv* methods raise TimeoutError if `timeout` seconds pass without
+      enough output, leaving any partial output in the buffer
+
+    ex) with tube("./chall") as t:
+            t.recvuntil(b"> ")
+            t.sendline(b"payload")
+    """
+
+    def __init__(self, cmd, *, shell=None):
+        # Empty binput only requests a pipe attached to stdin
+        self.proc, self.fd_p = _spawn(cmd, b'', shell=shell)
+        self._buffer = bytearray()
+        self._eof = False
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.fd_p, selectors.EVENT_READ)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+    @property
+    def returncode(self):
+        """
+        Return code of the process or None if still running
+        """
+        return self.proc.poll()
+
+
+    def _fill(self, timeout):
+        """
+        Private method for reading available output into the buffer
+        Returns False if nothing could be read within `timeout` seconds
+        """
+        if self._eof:
+            return False
+        if not self._selector.select(timeout):
+            return False
+
+        # Buffer is consumed from the front, which bytearray amortizes
+        # without moving the remaining bytes on every read
+        chunk = _read_pty(self.fd_p, _READ_MAX)
+        if not chunk:
+            self._eof = True
+        self._buffer += chunk
+        return True
+
+
+    def _take(self, n):
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+
+    def send(self, data):
+        """
+        Write byte data to the stdin of the process
+        """
+        _check_binput(data)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.proc.stdin.fileno(), view):]
+
+
+    def sendline(self, data):
+        """
+        Write byte data followed by a newline to the stdin of the process
+        """
+        self.send(bytes(data) + b'\n')
+
+
+    def recv(self, n=_READ_MIN, timeout=None):
+        """
+        Read at most `n` bytes of output
+        Returns b'' if the process closed its output
+        """
+        if not self._buffer and not self._fill(timeout) and not self._eof:
+            raise TimeoutError(f"No output within {timeout} seconds")
+
+        return self._take(n)
+
+
+    def recvuntil(self, delim, timeout=None, *, drop=False):
+        """
+        Read output until `delim` is found
+        If drop == True, strip `delim` from the returned bytes
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while True:
+            index = self._buffer.find(delim, start)
+            if index >= 0:
+                data = self._take(index + len(delim))
+                return data[:-len(delim)] if drop else data
+
+            if self._eof:
+                raise EOFError(f"Output closed before {delim}")
+
+            # Only search newly read output on the next iteration
+            start = max(0, len(self._buffer) - len(delim) + 1)
+
+            remaining = None
+            if deadline is not None:
+                remaining = max(0, deadline - time.monotonic())
+            if not self._fill(remaining):
+                raise TimeoutError(f"{delim} not found within {timeout} seconds")
+
+
+    def recvline(self, timeout=None, *, drop=False):
+        """
+        Read output until the end of the line
+        - Pseudo tty ends lines with b"\\r\\n"
+        """
+        return self.recvuntil(b'\n', timeout, drop=drop)
+
+
+    def close(self):
+        """
+        Close stdin and output, kill the process if still running
+        Returns the return code of the process
+        """
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+            os.close(self.fd_p)
+            try:
+                self.proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        if self.proc.poll() is None:
+            self.proc.kill()
+        return self.proc.wait()
+
+
+class forkserver:
+    """
+    Runner for executing the same binary many times like exec()
+    with processes spawned ahead of time by a background thread
+
+    - Process spawn and dynamic linking happen while the previous run
+      is being handled, so run() only pays for feeding input and
+      collecting output
+    - Each process is used once since a target cannot be reset
+    - Pre-spawned processes always get a stdin pipe, so stdin
+      is empty rather than inherited if binput is not supplied
+
+    ex) with forkserver("./chall", workers=8) as fs:
+            output, returncode = fs.run(b"payload")
+    """
+
+    def __init__(self, exec_path, *args, workers=4):
+        """
+        Pre-spawn `workers` processes of `exec_path` with arguments `args`
+        - args may contain `N< file` redirections like exec()
+        """
+        if workers < 1:
+            raise ValueError(f"`workers` argument must be positive: {workers}")
+
+        self.argv = [str(exec_path), *args]
+        self._ready = queue.Queue(maxsize=workers)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._prespawn, daemon=True)
+        self._thread.start()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+    def _prespawn(self):
+        """
+        Private method for keeping the queue of ready processes full
+        """
+        while not self._closed.is_set():
+            try:
+                child = _spawn(self.argv, b'', shell=False, session=True)
+            except BaseException as err:
+                # Hand the error over to run()
+                child = err
+
+            while True:
+                try:
+                    self._ready.put(child, timeout=0.1)
+                    break
+                except queue.Full:
+                    if self._closed.is_set():
+                        self._discard(child)
+                        return
+
+
+    @staticmethod
+    def _discard(child):
+        if isinstance(child, BaseException):
+            return
+
+        proc, fd_p = child
+        proc.kill()
+        os.close(fd_p)
+        if proc.stdin is not None:
+            proc.stdin.close()
+        proc.wait()
+
 
-    return output.decode().strip(), res.returncode
+    def run(self, binput=b'', *, timeout=None, max_output=None):
+        """
+        Run a pre-spawned process with `binput` as stdin
+        Returns result as (console output, return code) like exec()
+        - timeout and max_output behave like exec()
+        """
+        if self._closed.is_set():
+            raise RuntimeError("Cannot run on a closed forkserver")
+        _check_binput(binput)
+
+        child = self._ready.get()
+        if isinstance(child, BaseException):
+            raise child
+
+        proc, fd_p = child
+        return _communicate(proc, fd_p, binput or b'', timeout, max_output)[:2]
+
+
+    def close(self):
+        """
+        Stop pre-spawning and kill all unused processes
+        """
+        self._closed.set()
+        self._thread.join()
+        while True:
+            try:
+                self._discard(self._ready.get_nowait())
+            except queue.Empty:
+                break
+
+
+def _timed_exec(cmd, binput, options):
+    start = time.perf_counter()
+    try:
+        result = exec(cmd, binput=binput, **options)
+    except ExecAborted as err:
+        usage = err.usage if options['rusage'] else None
+        return exec_result(err.output, err.returncode,
+            time.perf_counter() - start, err.reason, usage)
+
+    if options['rusage']:
+        return result
+    return exec_result(*result, time.perf_counter() - start)
+
+
+def exec_many(cmds, *, workers=None, binputs=None, threads=False,
+    shell=None, timeout=None, max_output=None, rusage=False):
+    """
+    Run every command of `cmds` through exec() on a pool of workers
+    Returns list of exec_result(output, returncode, elapsed, reason, usage)
+    in the order of `cmds` where elapsed is the wall time of each run
+    in seconds and reason is why a run was stopped early, if it was
+
+    - If supplied, binputs is a sequence of stdin data matching `cmds`
+    - shell, timeout, max_output and rusage are passed to every exec() call
+    - See summarize_exec() to aggregate the results
+    - workers is the pool size (default = number of CPUs)
+    - threads: boolean
+        * If true, use a thread pool instead of a process pool
+    """
+    cmds = list(cmds)
+    binputs = [None] * len(cmds) if binputs is None else list(binputs)
+    if len(binputs) != len(cmds):
+        raise ValueError(f"Expected {len(cmds)} binputs: {len(binputs)}")
+
+    options = {'shell': shell, 'timeout': timeout, 'max_output': max_output,
+        'rusage': rusage}
+    options = [options] * len(cmds)
+    workers = workers or os.cpu_count() or 1
+    if threads:
+        with ThreadPoolExecutor(workers) as pool:
+            return list(pool.map(_timed_exec, cmds, binputs, options))
+
+    # Hand out commands in batches to cut down on inter-process traffic
+    chunksize = max(1, len(cmds) // (workers * 4))
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_timed_exec, cmds, binputs, options,
+            chunksize=chunksize))
+
+
+# Summary of one metric over many exec_result
+# - argmax is the index of the result with the largest value
+exec_stats = namedtuple('exec_stats',
+    ['count', 'total', 'mean', 'median', 'stdev', 'p95', 'max', 'argmax'])
+
+
+def summarize_exec(results):
+    """
+    Aggregate exec_result of many runs (ex. from exec_many(rusage=True))
+    Returns dict of metric name -> exec_stats
+
+    - Metrics: elapsed and every field of exec_usage
+    - Results without usage only count towards elapsed
+    - Metrics without any value are left out
+    """
+    results = list(results)
+    columns = {'elapsed': [(i, x.elapsed) for i, x in enumerate(results)]}
+    for field in exec_usage._fields:
+        columns[field] = [(i, getattr(x.usage, field))
+            for i, x in enumerate(results) if x.usage is not None]
 
+    summary = {}
+    for name, column in columns.items():
+        if not column:
+            continue
+        values = [x for _, x in column]
+        argmax, peak = max(column, key=lambda x: x[1])
+        p95 = statistics.quantiles(values, n=20)[-1] if len(values) > 1 \
+            else values[0]
+        summary[name] = exec_stats(len(values), sum(values),
+            statistics.fmean(values), statistics.median(values),
+            statistics.pstdev(values), p95, peak, argmax)
+    return summary
 
-def pwn_college():
+async def _async_read_pty(fd_p):
+    """
+    Read non-blocking pty master `fd_p` on the running event loop until EOF
+    Returns collected output as bytes
+    """
+    loop = asyncio.get_running_loop()
+    eof = loop.create_future()
+    chunks = []
+    read_size = _READ_MIN
+
+    def on_readable():
+        nonlocal read_size
+        try:
+            chunk = _read_pty(fd_p, read_size)
+        except BlockingIOError:
+            return
+        except OSError as err:
+            loop.remove_reader(fd_p)
+            eof.set_exception(err)
+            return
+
+        if not chunk:
+            loop.remove_reader(fd_p)
+            eof.set_result(None)
+            return
+
+        if len(chunk) == read_size and read_size < _READ_MAX:
+            read_size <<= 1
+        chunks.append(chunk)
+
+    loop.add_reader(fd_p, on_readable)
+    try:
+        await eof
+    finally:
+        loop.remove_reader(fd_p)
+
+    return b''.join(chunks)
+
+
+async def _async_feed(stream, binput):
+    """
+    Write `binput` to asyncio StreamWriter `stream` and close it
+    """
+    try:
+        stream.write(binput)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # Child does not read stdin anymore
+        pass
+    finally:
+        stream.close()
+
+
+def _feed(stream, binput):
+    """
+    Write `binput` to blocking file object `stream` and close it
+    """
+    try:
+        stream.write(binput)
+        stream.flush()
+    except BrokenPipeError:
+        # Child does not read stdin anymore
+        pass
+    finally:
+        try:
+            stream.close()
+        except BrokenPipeError:
+            pass
+
+
+async def async_exec(cmd, *, binput=None, shell=None, semaphore=None):
+    """
+    Coroutine version of exec() to run many processes on one event loop
+    Returns result as (console output, return code)
+
+    - If supplied, binput is byte data passed to the stdin
+    - shell: same as exec()
+    - If supplied, semaphore is an asyncio.Semaphore shared between calls
+      to limit the number of concurrently running processes
+
+    ex) await asyncio.gather(async_exec(cmd1), async_exec(cmd2))
+    """
+    if semaphore is not None:
+        async with semaphore:
+            return await async_exec(cmd, binput=binput, shell=shell)
+
+    _check_binput(binput)
+    if shell is None:
+        shell = isinstance(cmd, str)
+
+    # The shell redirects by itself, files are only opened to report
+    # errors like exec()
+    parsed_cmd = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+    argv, redirects = _open_redirects(parsed_cmd)
+    for _, fd_file in redirects:
+        os.close(fd_file)
+    if not shell and not argv:
+        raise ValueError(f"No executable to run: {cmd}")
+
+    loop = asyncio.get_running_loop()
+    fd_p = None
+    proc = None
+    # Whether `proc` is a blocking Popen-like object driven through threads
+    blocking = redirects and not shell
+    try:
+        if blocking:
+            # Only _spawn() can move files to their desired fd in the child
+            proc, fd_p = _spawn(parsed_cmd, binput, shell=False)
+        else:
+            fd_p, fd_c = openpty()
+            try:
+                stdin = PIPE if binput is not None else None
+                if shell:
+                    args = cmd if isinstance(cmd, str) else ' '.join(cmd)
+                    proc = await asyncio.create_subprocess_shell(args,
+                        stdin=stdin, stdout=fd_c, stderr=fd_c)
+                else:
+                    proc = await asyncio.create_subprocess_exec(*argv,
+                        stdin=stdin, stdout=fd_c, stderr=fd_c)
+            finally:
+                # Child process holds its own copies from here on
+                os.close(fd_c)
+        os.set_blocking(fd_p, False)
+
+        reader = asyncio.ensure_future(_async_read_pty(fd_p))
+        try:
+            if binput is not None and blocking:
+                await loop.run_in_executor(None, _feed, proc.stdin, binput)
+            elif binput is not None:
+                await _async_feed(proc.stdin, binput)
+            output = await reader
+        finally:
+            reader.cancel()
+
+        if blocking:
+            await loop.run_in_executor(None, proc.wait)
+        else:
+            await proc.wait()
+    except BaseException:
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+            if blocking:
+                await loop.run_in_executor(None, proc.wait)
+            else:
+                await proc.wait()
+        raise
+    finally:
+        if fd_p is not None:
+            os.close(fd_p)
+
+    return output.decode().strip(), proc.returncode
+
+
+async def async_exec_many(cmds, *, binputs=None, shell=None, limit=32):
+    """
+    Run every command of `cmds` through async_exec() concurrently
+    Returns list of (console output, return code) in the order of `cmds`
+
+    - If supplied, binputs is a sequence of stdin data matching `cmds`
+    - shell is passed to every async_exec() call
+    - limit is the maximum number of concurrently running processes
+    """
+    cmds = list(cmds)
+    binputs = [None] * len(cmds) if binputs is None else list(binputs)
+    if len(binputs) != len(cmds):
+        raise ValueError(f"Expected {len(cmds)} binputs: {len(binputs)}")
+
+    semaphore = asyncio.Semaphore(limit)
+    return await asyncio.gather(*(async_exec(cmd, binput=binput, shell=shell,
+        semaphore=semaphore) for cmd, binput in zip(cmds, binputs)))
+
+
+# (roots, patterns) -> (mtimes of roots, path found or None)
+_pwn_college_cache = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _name_matcher(patterns):
+    """
+    Compile fnmatch `patterns` into a single regex matching any of them
+    """
+    return re.compile('|'.join(fnmatch.translate(x) for x in patterns))
+
+
+def pwn_college(roots=('/',), patterns=('*',), *, cache=True):
     """
     Get path of pwn.college CTF executable file
     by finding first executable file in root that does not start with '.'
+
+    - roots: directory or sequence of directories searched in order
+    - patterns: glob pattern or sequence of them the file name must match
+    - Each root is listed once with os.scandir(), only files with
+      a matching name are checked for execute permission
+    - cache: boolean
+        * If true, remember the result until the mtime of a root changes
+          or the file found is no longer executable
     """
-    for file in Path('/').iterdir():
-        if file.is_file() and not file.name.startswith('.') \
-            and os.access(file, os.X_OK):
-            return str(file)
+    if isinstance(roots, (str, os.PathLike)):
+        roots = (roots,)
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    roots = tuple(os.fspath(x) for x in roots)
+    patterns = tuple(patterns)
+
+    key = (roots, patterns)
+    mtimes = tuple(os.stat(x).st_mtime_ns for x in roots)
+    if cache and key in _pwn_college_cache:
+        cached_mtimes, path = _pwn_college_cache[key]
+        if cached_mtimes == mtimes \
+            and (path is None or os.access(path, os.X_OK)):
+            return path
+
+    matcher = _name_matcher(patterns)
+    path = None
+    for root in roots:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not entry.name.startswith('.') and matcher.match(entry.name) \
+                    and entry.is_file() and os.access(entry.path, os.X_OK):
+                    path = entry.path
+                    break
+        if path is not None:
+            break
+
+    _pwn_college_cache[key] = (mtimes, path)
+    return path
 
 
 def parse_objdump_line(line):
@@ -138,16 +1219,954 @@ def parse_objdump_line(line):
     return [inst_pos, machine_code, inst[0]] + params
 
 
-def get_objdump(exec_path):
+class instruction(namedtuple('instruction',
+    ['address', 'opcode', 'mnemonic', 'operands'])):
+    """
+    Compact record of a parsed objdump instruction line
+
+    - address: int
+    - opcode: machine code as bytes (b'' if the line has none)
+    - mnemonic: interned str
+    - operands: tuple of interned str
+    """
+    __slots__ = ()
+
+
+    @classmethod
+    def fromlist(cls, parsed):
+        """
+        Create record from the list format of parse_objdump_line()
+        """
+        return cls(int(parsed[0], 16), _opcode(parsed[1]),
+            sys.intern(parsed[2]), tuple(map(sys.intern, parsed[3:])))
+
+
+    def aslist(self):
+        """
+        Convert to the list format of parse_objdump_line()
+        """
+        code = self.opcode.hex(' ') if self.opcode else "<no OP code>"
+        return [format(self.address, 'x'), code, self.mnemonic, *self.operands]
+
+
+_HEX_BYTE = re.compile(r'(?<![0-9A-Za-z])[0-9a-f]{2}(?![0-9A-Za-z])')
+
+
+def _opcode(machine_code):
+    """
+    Convert machine code column of objdump to bytes
+    ignoring "<no OP code>" and jump visuals
+    """
+    try:
+        return bytes.fromhex(machine_code)
+    except ValueError:
+        return bytes.fromhex(''.join(_HEX_BYTE.findall(machine_code)))
+
+# Fields of parse_objdump_line() for every line without jump visuals
+_OBJDUMP_INSTRUCTIONS = re.compile(
+    r'^ *([0-9a-f]+):\t(?:([^\t\n]*)\t)? *(\S+)(?: +([^#<\n]*))?', re.M)
+
+# Number of lines matched by a single regex pass in parse_objdump_lines()
+_PARSE_BATCH = 1 << 12
+
+
+def _parse_objdump_batch(lines):
+    """
+    Parse instruction lines of `lines` with a single regex pass
+    Returns list of instruction records
+    """
+    new = tuple.__new__
+    intern = sys.intern
+    fields = _OBJDUMP_INSTRUCTIONS.findall('\n'.join(lines))
+    try:
+        opcodes = [bytes.fromhex(x[1]) for x in fields]
+    except ValueError:
+        # Machine code column contains jump visuals
+        opcodes = [_opcode(x[1]) for x in fields]
+
+    return [new(instruction, (int(address, 16), opcode, intern(mnemonic),
+        tuple(map(intern, operands.rstrip().split(','))) if operands else ()))
+        for (address, _, mnemonic, operands), opcode in zip(fields, opcodes)]
+
+
+def parse_objdump_lines(lines):
+    """
+    Generator parsing objdump instruction lines of `lines` into
+    instruction(address, opcode, mnemonic, operands) records
+    holding the same fields as parse_objdump_line()
+
+    - Lines that are not instruction lines are skipped
+    - Lines are matched in batches by one precompiled regex,
+      lines with jump visuals fall back to parse_objdump_line()
+    """
+    batch = []
+    for line in lines:
+        if '\x1b' in line:
+            yield from _parse_objdump_batch(batch)
+            batch = []
+            if ":\t" in line:
+                yield instruction.fromlist(parse_objdump_line(line))
+            continue
+
+        batch.append(line)
+        if len(batch) == _PARSE_BATCH:
+            yield from _parse_objdump_batch(batch)
+            batch = []
+
+    yield from _parse_objdump_batch(batch)
+
+
+elf_section = namedtuple('elf_section',
+    ['name', 'type', 'flags', 'addr', 'offset', 'size', 'link', 'entsize'])
+
+elf_symbol = namedtuple('elf_symbol',
+    ['name', 'value', 'size', 'type', 'bind', 'shndx'])
+
+elf_segment = namedtuple('elf_segment',
+    ['type', 'flags', 'offset', 'vaddr', 'filesz', 'memsz'])
+
+_PT_LOAD = 1
+_SHT_SYMTAB = 2
+_SHT_DYNSYM = 11
+
+_STT_NAMES = {0: 'NOTYPE', 1: 'OBJECT', 2: 'FUNC', 3: 'SECTION', 4: 'FILE',
+    5: 'COMMON', 6: 'TLS', 10: 'GNU_IFUNC'}
+_STB_NAMES = {0: 'LOCAL', 1: 'GLOBAL', 2: 'WEAK', 10: 'GNU_UNIQUE'}
+
+# struct formats (without byte order) indexed by ELF class (32 or 64 bit)
+_ELF_HEADER = {32: '16sHHIIIIIHHHHHH', 64: '16sHHIQQQIHHHHHH'}
+_ELF_SECTION = {32: 'IIIIIIIIII', 64: 'IIQQQQIIQQ'}
+_ELF_SYMBOL = {32: 'IIIBBH', 64: 'IBBHQQ'}
+_ELF_SEGMENT = {32: 'IIIIIIII', 64: 'IIQQQQQQ'}
+
+
+class elf:
+    """
+    ELF file reader parsing headers, section headers and symbol tables
+    straight from a read-only mmap instead of objdump output
+
+    - sections: dict of section name -> elf_section
+    - segments: list of elf_segment from the program headers
+    - symbols: dict of symbol name -> elf_symbol from .symtab and .dynsym
+    - functions: dict of function name -> (start address, stop address)
+    - Tables are parsed on first access and kept afterwards
+
+    ex) with elf(path) as binary:
+            binary.symbols['main'].value
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        ident = self._map[:16]
+        if ident[:4] != b'\x7fELF' or ident[4] not in (1, 2) \
+            or ident[5] not in (1, 2):
+            self.close()
+            raise ValueError(f"Not an ELF file: {self.path}")
+
+        self.bits = 32 if ident[4] == 1 else 64
+        self._order = '<' if ident[5] == 1 else '>'
+
+        header = self._unpack(_ELF_HEADER, 0)
+        (_, self.type, self.machine, _, self.entry, self._phoff, self._shoff,
+            _, _, _, self._phnum, _, self._shnum, self._shstrndx) = header
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+    def close(self):
+        self._map.close()
+
+
+    def _unpack(self, formats, offset):
+        return struct.unpack_from(self._order + formats[self.bits],
+            self._map, offset)
+
+
+    def _string(self, offset):
+        """
+        Private method for reading a NUL-terminated string at `offset`
+        """
+        end = self._map.find(b'\0', offset)
+        return self._map[offset:end].decode(errors='replace')
+
+
+    @functools.cached_property
+    def _section_headers(self):
+        if self._shoff == 0:
+            return []
+
+        fmt = struct.Struct(self._order + _ELF_SECTION[self.bits])
+        first = fmt.unpack_from(self._map, self._shoff)
+        # Extended numbering stores large counts in the first section header
+        shnum = self._shnum or first[5]
+        shstrndx = first[6] if self._shstrndx == 0xffff else self._shstrndx
+
+        table = self._map[self._shoff:self._shoff + shnum * fmt.size]
+        headers = list(fmt.iter_unpack(table))
+        strtab = headers[shstrndx][4] if shstrndx < len(headers) else None
+        return [(self._string(strtab + x[0]) if strtab is not None else '',
+            *x[1:7], x[9]) for x in headers]
+
+
+    @functools.cached_property
+    def sections(self):
+        """
+        Dict of section name -> elf_section(name, type, flags, addr,
+        offset, size, link, entsize) in file order
+        """
+        return {x[0]: elf_section(*x) for x in self._section_headers if x[0]}
+
+
+    @functools.cached_property
+    def segments(self):
+        """
+        List of elf_segment(type, flags, offset, vaddr, filesz, memsz)
+        in program header order
+        """
+        if self._phoff == 0:
+            return []
+
+        fmt = struct.Struct(self._order + _ELF_SEGMENT[self.bits])
+        table = self._map[self._phoff:self._phoff + self._phnum * fmt.size]
+        segments = []
+        for entry in fmt.iter_unpack(table):
+            if self.bits == 64:
+                type, flags, offset, vaddr, _, filesz, memsz, _ = entry
+            else:
+                type, offset, vaddr, _, filesz, memsz, flags, _ = entry
+            segments.append(
+                elf_segment(type, flags, offset, vaddr, filesz, memsz))
+        return segments
+
+
+    def address(self, offset):
+        """
+        Get virtual address of file `offset`
+        Returns None if no loadable segment maps it
+        """
+        for x in self.segments:
+            if x.type == _PT_LOAD and x.offset <= offset < x.offset + x.filesz:
+                return x.vaddr + offset - x.offset
+        return None
+
+
+    @functools.cached_property
+    def symbols(self):
+        """
+        Dict of symbol name -> elf_symbol(name, value, size, type, bind,
+        shndx) where type and bind are names like 'FUNC' and 'GLOBAL'
+        - .symtab entries take precedence over .dynsym entries
+        """
+        symbols = {}
+        tables = [x for x in self._section_headers
+            if x[1] in (_SHT_SYMTAB, _SHT_DYNSYM)]
+        tables.sort(key=lambda x: x[1] != _SHT_SYMTAB)
+
+        for _, _, _, _, offset, size, link, entsize in tables:
+            fmt = struct.Struct(self._order + _ELF_SYMBOL[self.bits])
+            if entsize != fmt.size or link >= len(self._section_headers):
+                continue
+            strtab = self._section_headers[link][4]
+
+            for entry in fmt.iter_unpack(self._map[offset:offset + size]):
+                if self.bits == 64:
+                    name, info, _, shndx, value, sym_size = entry
+                else:
+                    name, value, sym_size, info, _, shndx = entry
+                if name == 0:
+                    continue
+
+                name = self._string(strtab + name)
+                if name not in symbols:
+                    symbols[name] = elf_symbol(name, value, sym_size,
+                        _STT_NAMES.get(info & 0xf, info & 0xf),
+                        _STB_NAMES.get(info >> 4, info >> 4), shndx)
+        return symbols
+
+
+    @functools.cached_property
+    def functions(self):
+        """
+        Dict of function name -> (start address, stop address)
+        for defined function symbols with a known size
+        """
+        return {x.name: (x.value, x.value + x.size)
+            for x in self.symbols.values()
+            if x.type in ('FUNC', 'GNU_IFUNC') and x.shndx and x.size}
+
+
+search_match = namedtuple('search_match', ['pattern', 'offset', 'address'])
+
+_HEX_DIGITS = '0123456789abcdef'
+
+
+def _byte_pattern(pattern):
+    """
+    Convert search_bytes() `pattern` into bytes regex
+    """
+    if isinstance(pattern, (bytes, bytearray, memoryview)):
+        if not pattern:
+            raise ValueError("Empty byte pattern")
+        return re.escape(bytes(pattern))
+
+    digits = ''.join(pattern.split()).lower()
+    if not digits or len(digits) % 2 or digits.strip(_HEX_DIGITS + '?'):
+        raise ValueError(f"Invalid byte pattern: {pattern!r}")
+
+    regex = []
+    for hi, lo in zip(digits[::2], digits[1::2]):
+        if hi == lo == '?':
+            regex.append(b'.')
+        elif '?' in (hi, lo):
+            values = (int(x + y, 16)
+                for x in (_HEX_DIGITS if hi == '?' else hi)
+                for y in (_HEX_DIGITS if lo == '?' else lo))
+            regex.append(b'[' + b''.join(re.escape(bytes([x])) for x in values)
+                + b']')
+        else:
+            regex.append(re.escape(bytes.fromhex(hi + lo)))
+    return b''.join(regex)
+
+
+def search_bytes(path, *patterns):
+    """
+    Find every occurrence of `patterns` in file `path`, overlapping ones included
+
+    - patterns: bytes matched literally, or str of hex bytes where
+      ? matches any nibble and whitespace is ignored e.g. "48 8b ?? ?5"
+    - The file is searched through a read-only mmap in a single pass
+      for all patterns together, so it is never read into memory
+    - Returns list of search_match(pattern, offset, address) sorted by
+      offset, where address is the virtual address the offset is loaded
+      at, or None if not loaded or `path` is not an ELF file
+    """
+    if not patterns:
+        raise ValueError("No pattern to search")
+    regexes = [_byte_pattern(x) for x in patterns]
+
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return []
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # (pattern index, file offset)
+    hits = []
+    with data:
+        if len(patterns) == 1 and not isinstance(patterns[0], str):
+            literal = bytes(patterns[0])
+            offset = data.find(literal)
+            while offset != -1:
+                hits.append((0, offset))
+                offset = data.find(literal, offset + 1)
+        else:
+            # A lookahead matches empty so every start offset is tried,
+            # but only reports the first matching alternative there
+            combined = re.compile(b'(?=' + b'|'.join(b'(' + x + b')'
+                for x in regexes) + b')', re.S)
+            compiled = [re.compile(x, re.S) for x in regexes]
+            for match in combined.finditer(data):
+                offset = match.start()
+                for i in range(match.lastindex - 1, len(regexes)):
+                    if i == match.lastindex - 1 \
+                        or compiled[i].match(data, offset):
+                        hits.append((i, offset))
+
+    try:
+        binary = elf(path)
+    except ValueError:
+        return [search_match(patterns[i], x, None) for i, x in hits]
+    with binary:
+        return [search_match(patterns[i], x, binary.address(x))
+            for i, x in hits]
+
+
+class _result_cache:
+    """
+    Two-level LRU cache of analysis results keyed by binary content
+
+    - Memory: up to `max_entries` most recently used results
+    - Disk: zlib compressed pickles in `path` up to `max_bytes` in total,
+      least recently used files are evicted first
+    - Cached results are shared between hits, so do not mutate them
+    """
+
+    def __init__(self, path, *, max_entries=16, max_bytes=256 << 20):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()
+        # (path, device, inode, size, mtime) -> content hash
+        self._digests = {}
+
+
+    def digest(self, file_path):
+        """
+        Get sha256 hex digest of file content
+        - Remembered until the file is replaced or modified
+        """
+        stat = os.stat(file_path)
+        file_key = (os.path.realpath(file_path), stat.st_dev, stat.st_ino,
+            stat.st_size, stat.st_mtime_ns)
+        if file_key not in self._digests:
+            sha = hashlib.sha256()
+            with open(file_path, 'rb') as file:
+                for block in iter(lambda: file.read(1 << 20), b''):
+                    sha.update(block)
+            self._digests[file_key] = sha.hexdigest()
+        return self._digests[file_key]
+
+
+    def key(self, *parts):
+        """
+        Combine `parts` into a cache key usable as a file name
+        """
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+    def get(self, key):
+        """
+        Get cached result of `key` or None if missing
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        file_path = self.path / key
+        try:
+            data = file_path.read_bytes()
+            # Mark as recently used for eviction
+            os.utime(file_path)
+        except OSError:
+            return None
+
+        try:
+            value = pickle.loads(zlib.decompress(data))
+        except Exception:
+            # Corrupt, or pickled classes moved since (ex. package renamed)
+            file_path.unlink(missing_ok=True)
+            return None
+
+        self._remember(key, value)
+        return value
+
+
+    def put(self, key, value):
+        """
+        Cache `value` as result of `key` in memory and on disk
+        - Disk errors are ignored since the cache is only an optimization
+        """
+        self._remember(key, value)
+
+        data = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        if len(data) > self.max_bytes:
+            return
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path / f".{key}.{os.getpid()}"
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.path / key)
+            self._evict()
+        except OSError:
+            pass
+
+
+    def clear(self):
+        """
+        Remove every cached result from memory and disk
+        """
+        self._memory.clear()
+        self._digests.clear()
+        if self.path.is_dir():
+            for file in self.path.iterdir():
+                file.unlink(missing_ok=True)
+
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+    def _evict(self):
+        files = [(x.stat(), x) for x in self.path.iterdir() if x.is_file()]
+        total = sum(stat.st_size for stat, _ in files)
+        for stat, file in sorted(files, key=lambda x: x[0].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            file.unlink(missing_ok=True)
+            total -= stat.st_size
+
+
+_cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+analysis_cache = _result_cache(Path(_cache_home) / 'yscpwn')
+
+_OBJDUMP_FLAGS = ('-z', '-M', 'intel', '-d', '-j', '.text')
+
+# Bumped whenever get_objdump() rows change so cached results are not reused
+_OBJDUMP_FORMAT = 2
+
+# Address and machine code of an instruction line, or address of a label line
+_OBJDUMP_ADDRESS = re.compile(r'^\s*([0-9a-f]+)(?::\t([0-9a-f ]*)| <.*>:$)')
+
+# Bytes disassembled beyond chunk boundaries by get_objdump(workers > 1)
+# - Before: lets the decoder fall back in step with the previous chunk
+# - After: covers an instruction starting right before the boundary
+_CHUNK_LEAD = 256
+_CHUNK_TAIL = 16
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_version(tool):
+    res = run([tool, '--version'], capture_output=True)
+    return res.stdout.decode(errors='replace').partition('\n')[0]
+
+
+def _section_bounds(exec_path, name):
+    """
+    Get (start, stop) virtual addresses of section `name`
+    """
+    with elf(exec_path) as binary:
+        if name not in binary.sections:
+            raise ValueError(f"No {name} section in {exec_path}")
+        section = binary.sections[name]
+    return section.addr, section.addr + section.size
+
+
+def _objdump_chunk(exec_path, start, stop, keep_start, keep_stop, headers):
+    """
+    Disassemble and parse start <= address < stop like get_objdump()
+    keeping lines of keep_start <= address < keep_stop
+
+    - headers: boolean
+        * If true, keep file and section header lines
+        * Otherwise also drop the label objdump makes up for `start`
+    - Returns (kept lines joined by \\n, parsed lines as \\n-separated
+      rows of \\0-separated fields, end address of last kept instruction)
+      since a few large strings are far cheaper to send between processes
+    """
+    argv = ['objdump', *_OBJDUMP_FLAGS, f"--start-address={start:#x}",
+        f"--stop-address={stop:#x}", str(exec_path)]
+    dump = run(argv, capture_output=True).stdout.decode().strip()
+
+    lines = []
+    end = keep_start
+    for line in helper.split(dump, '\n'):
+        span = _OBJDUMP_ADDRESS.match(line)
+        if span is None:
+            if headers:
+                lines.append(line)
+            continue
+
+        address = int(span[1], 16)
+        if address >= keep_stop:
+            break
+        if address < keep_start:
+            continue
+        if span[2] is None:
+            if not headers and address == start \
+                and ('+0x' in line or '-0x' in line):
+                continue
+        else:
+            end = address + len(span[2].split())
+        lines.append(line)
+
+    parsed = ('\0'.join(parse_objdump_line(x)) for x in lines if ":\t" in x)
+    return '\n'.join(lines), '\n'.join(parsed), end
+
+
+def _objdump_sync(lines, end):
+    """
+    Get number of leading `lines` decoded before instruction at `end`
+    Returns None if no instruction starts at `end`
+    """
+    for i, line in enumerate(lines):
+        span = _OBJDUMP_ADDRESS.match(line)
+        if span and span[2] is not None and int(span[1], 16) >= end:
+            return i if int(span[1], 16) == end else None
+    return None
+
+
+def _objdump_parallel(exec_path, workers):
+    """
+    Disassemble .text section in `workers` address ranges concurrently
+    and merge them into the same result as a single objdump run
+
+    x86 instructions are variable length, so each range starts a little
+    early and is only used from the instruction where the previous range
+    ended, which the decoder reaches again after a few instructions.
+    A range that never gets back in step is disassembled again from there.
+    """
+    start, stop = _section_bounds(exec_path, '.text')
+    step = -(-(stop - start) // workers)
+    bounds = list(range(start, stop, step)) + [stop]
+    args = [(exec_path, max(start, lo - _CHUNK_LEAD),
+        min(stop, hi + _CHUNK_TAIL), lo, hi, k == 0)
+        for k, (lo, hi) in enumerate(zip(bounds, bounds[1:]))]
+
+    with ProcessPoolExecutor(workers) as pool:
+        chunks = list(pool.map(_objdump_chunk, *zip(*args)))
+
+    dump = []
+    parsed_asm = []
+    end = start
+    for k, (lines, parsed, chunk_end) in enumerate(chunks):
+        hi = bounds[k + 1]
+        if end >= hi:
+            # Previous instruction covered this whole range
+            continue
+
+        lines = lines.split('\n') if lines else []
+        skip = _objdump_sync(lines, end) if k > 0 else 0
+        if skip is None:
+            lines, parsed, chunk_end = _objdump_chunk(exec_path, end,
+                min(stop, hi + _CHUNK_TAIL), end, hi, False)
+            lines = lines.split('\n') if lines else []
+            skip = 0
+
+        parsed = [x.split('\0') for x in parsed.split('\n')] if parsed else []
+        skip_parsed = sum(":\t" in x for x in lines[:skip])
+        dump += lines[skip:]
+        parsed_asm += parsed[skip_parsed:]
+        end = chunk_end
+
+    return dump, parsed_asm
+
+
+def get_objdump(exec_path, *, cache=True, workers=1, records=False):
     """
     Get and parse objdump of `exec_path` .text section in intel assembly
 
     Returns tuple(\n-separated raw dump, parsed )
+
+    - cache: boolean
+        * If true, reuse results from `analysis_cache` keyed by the
+          content of `exec_path`, objdump flags and objdump version
+        * Rows are immutable and shared with the cache, only the
+          returned lists are copied (about 1 ms per 100k lines)
+    - workers: int
+        * If greater than 1, split .text section into address ranges
+          disassembled and parsed by a pool of `workers` processes
+    - records: boolean
+        * If true, parse into compact instruction records
+        * Otherwise parse into tuples like parse_objdump_line()
     """
-    dump = exec_shell(f"objdump -z -M intel -d -j .text {exec_path}")
-    dump = helper.split(dump, '\n')
-    parsed_asm = [parse_objdump_line(x) for x in dump if ":\t" in x]
-    return (dump, parsed_asm)
+    if cache:
+        key = analysis_cache.key('objdump', _OBJDUMP_FORMAT,
+            analysis_cache.digest(exec_path), _OBJDUMP_FLAGS,
+            _tool_version('objdump'), records)
+        result = analysis_cache.get(key)
+        if result is not None:
+            return _copy_objdump(result)
+
+    if workers > 1:
+        dump, parsed_asm = _objdump_parallel(exec_path, workers)
+        if records:
+            parsed_asm = [instruction.fromlist(x) for x in parsed_asm]
+        else:
+            parsed_asm = list(map(tuple, parsed_asm))
+    else:
+        dump = capture(['objdump', *_OBJDUMP_FLAGS, str(exec_path)])
+        dump = helper.split(dump.decode().strip(), '\n')
+        if records:
+            parsed_asm = list(parse_objdump_lines(dump))
+        else:
+            parsed_asm = [tuple(parse_objdump_line(x))
+                for x in dump if ":\t" in x]
+    result = (dump, parsed_asm)
+
+    if cache:
+        analysis_cache.put(key, result)
+        return _copy_objdump(result)
+    return result
+
+
+def _copy_objdump(result):
+    """
+    Copy lists of get_objdump() result sharing its immutable rows
+    """
+    dump, parsed_asm = result
+    return list(dump), list(parsed_asm)
+
+
+def iter_objdump(exec_path, *, records=False):
+    """
+    Generator yielding parsed instructions of `exec_path` .text section
+    like get_objdump() while objdump is still running
+
+    - Lines are read and parsed one at a time, the dump is never held
+    - Closing the generator early terminates objdump
+    - records: same as get_objdump()
+        * Records are parsed in batches of lines
+
+    ex) for inst in iter_objdump(path):
+            if inst[2] == 'syscall': break
+    """
+    lines = capture_lines(['objdump', *_OBJDUMP_FLAGS, str(exec_path)])
+    with contextlib.closing(lines):
+        lines = (x.decode() for x in lines)
+        if records:
+            yield from parse_objdump_lines(lines)
+        else:
+            yield from (parse_objdump_line(x) for x in lines if ":\t" in x)
+
+
+class instruction_table:
+    """
+    Columnar table of parsed objdump instructions sorted by address
+    for O(log n) lookups by address, address range and mnemonic
+
+    Columns (aligned by row index)
+    - addresses: array of int
+    - opcodes: list of bytes
+    - mnemonics: list of interned str
+    - operands: list of tuple of interned str
+
+    Built from parse_objdump_line() lists or instruction records
+    Rows are returned in the list format of parse_objdump_line()
+
+    ex) table = instruction_table.from_objdump(path)
+        table.find('syscall', start=0x401000, stop=0x402000)
+    """
+
+    def __init__(self, parsed_asm):
+        rows = [x if isinstance(x, instruction) else instruction.fromlist(x)
+            for x in parsed_asm]
+        # objdump lists a section in order, so sorting is usually skipped
+        if any(rows[i][0] > rows[i + 1][0] for i in range(len(rows) - 1)):
+            rows.sort(key=lambda x: x[0])
+
+        self.addresses = array('Q', (x.address for x in rows))
+        self.opcodes = [x.opcode for x in rows]
+        self.mnemonics = [x.mnemonic for x in rows]
+        self.operands = [x.operands for x in rows]
+
+        # Mnemonic -> ascending row indices
+        self._by_mnemonic = {}
+        for i, mnemonic in enumerate(self.mnemonics):
+            self._by_mnemonic.setdefault(mnemonic, array('L')).append(i)
+
+
+    @classmethod
+    def from_objdump(cls, exec_path, **kwargs):
+        """
+        Build table from get_objdump(`exec_path`, **kwargs)
+        """
+        return cls(get_objdump(exec_path, **kwargs)[1])
+
+
+    def __len__(self):
+        return len(self.addresses)
+
+
+    def __getitem__(self, index):
+        """
+        Get row at `index` in the list format of parse_objdump_line()
+        """
+        return self.record(index).aslist()
+
+
+    def record(self, index):
+        """
+        Get row at `index` as instruction record
+        """
+        return instruction(self.addresses[index], self.opcodes[index],
+            self.mnemonics[index], self.operands[index])
+
+
+    def index(self, address):
+        """
+        Get row index of the instruction at `address`
+        """
+        i = bisect_left(self.addresses, address)
+        if i == len(self.addresses) or self.addresses[i] != address:
+            raise KeyError(f"No instruction at address: {hex(address)}")
+        return i
+
+
+    def at(self, address):
+        """
+        Get row of the instruction at `address`
+        """
+        return self[self.index(address)]
+
+
+    def between(self, start, stop):
+        """
+        Get rows of instructions with start <= address < stop
+        """
+        lo = bisect_left(self.addresses, start)
+        hi = bisect_left(self.addresses, stop, lo)
+        return [self[i] for i in range(lo, hi)]
+
+
+    def find(self, mnemonic, *, start=None, stop=None):
+        """
+        Get rows of instructions using `mnemonic`
+        If supplied, limit to start <= address < stop
+        """
+        indices = self._by_mnemonic.get(mnemonic, array('L'))
+        lo, hi = 0, len(indices)
+        if start is not None:
+            lo = bisect_left(indices, bisect_left(self.addresses, start))
+        if stop is not None:
+            hi = bisect_left(indices, bisect_left(self.addresses, stop), lo)
+        return [self[i] for i in indices[lo:hi]]
+
+
+# Gadget terminators: ret, ret imm16, syscall, int 0x80, jmp reg, call reg
+_GADGET_END = re.compile(
+    rb'(?=(\xc3|\xc2..|\x0f\x05|\xcd\x80|\xff[\xd0-\xd7\xe0-\xe7]))', re.S)
+
+# Separates gadget candidates disassembled in one objdump run
+# - An instruction running into it ends within its first 14 bytes,
+#   the remaining prefixes and nop then decode as one instruction
+#   so the next candidate is always decoded from its first byte
+_GADGET_PAD = b'\x66' * 14 + b'\x90'
+
+# Bumped whenever validation changes so cached results are not reused
+_GADGET_FORMAT = 2
+
+_GADGET_LINE = re.compile(r'^ *([0-9a-f]+):\t([0-9a-f ]+)\t([^\n]*)', re.M)
+# Prefixes dropped from gadget text
+_GADGET_PREFIXES = {'bnd', 'notrack'}
+
+# Every prefix objdump may print before a mnemonic, besides rex* and {...}
+_X86_PREFIXES = {'bnd', 'notrack', 'lock', 'rep', 'repz', 'repe', 'repnz',
+    'repne', 'xacquire', 'xrelease', 'data16', 'data32', 'addr16', 'addr32',
+    'cs', 'ds', 'es', 'fs', 'gs', 'ss'}
+_GADGET_MACHINES = {3: 'i386', 62: 'i386:x86-64'}
+_SHF_EXECINSTR = 0x4
+_SHT_NOBITS = 8
+
+
+def _gadget_text(decoded, stop):
+    """
+    Join decoded [address, size, text] instructions of a gadget candidate
+    ending at `stop` into gadget text
+    Returns None unless the last instruction, and only that one,
+    is a terminator ending exactly at `stop`
+    """
+    if not decoded or decoded[-1][0] + decoded[-1][1] != stop:
+        return None
+
+    texts = []
+    # Instructions without prefixes, used for validation only
+    bare = []
+    for *_, text in decoded:
+        words = text.partition('#')[0].split()
+        if '(bad)' in words:
+            return None
+        while words and words[0] in _GADGET_PREFIXES:
+            del words[0]
+        texts.append(words)
+
+        i = 0
+        while i < len(words) and (words[i] in _X86_PREFIXES
+            or words[i].startswith(('rex', '{'))):
+            i += 1
+        # lock without a memory operand raises #UD
+        if i == len(words) or ('lock' in words[:i] and '[' not in text):
+            return None
+        bare.append(words[i:])
+
+    for words in bare[:-1]:
+        if words[0][0] == 'j' or words[0].startswith(('ret', 'call', 'loop',
+            'sys', 'int', 'iret', 'hlt', 'ud')):
+            return None
+
+    # Prefixed terminators like `repz ret` count as the plain one
+    last = bare[-1]
+    if last[0] in ('jmp', 'call'):
+        if len(last) != 2 or not last[1].isalnum() or last[1][:2] == '0x':
+            return None
+    elif not (last[0] == 'ret' or last == ['syscall'] or last == ['int', '0x80']):
+        return None
+    return ' ; '.join(' '.join(x) for x in texts)
+
+
+def find_gadgets(exec_path, *, depth=10, cache=True):
+    """
+    Find ROP gadgets in executable sections of x86 ELF `exec_path`
+
+    - Gadgets end in ret, syscall, int 0x80, jmp reg or call reg and start
+      up to `depth` bytes before it, including unaligned instructions
+    - Candidates are disassembled by a single objdump run,
+      identical byte sequences only once
+    - cache: boolean
+        * If true, remember results by binary content (see analysis_cache)
+    - Returns dict of gadget text -> tuple of ascending addresses
+        e.g. find_gadgets(path)['pop rdi ; ret']
+    """
+    if cache:
+        key = analysis_cache.key('gadgets', _GADGET_FORMAT,
+            analysis_cache.digest(exec_path), depth, _tool_version('objdump'))
+        result = analysis_cache.get(key)
+        if result is not None:
+            # Address tuples are immutable, only the dict needs a copy
+            return dict(result)
+
+    # Candidate bytes -> start addresses
+    candidates = {}
+    with elf(exec_path) as binary:
+        if binary.machine not in _GADGET_MACHINES:
+            raise ValueError(f"Not an x86 binary: {exec_path}")
+        machine = _GADGET_MACHINES[binary.machine]
+
+        for section in binary.sections.values():
+            if not section.flags & _SHF_EXECINSTR \
+                or section.type == _SHT_NOBITS:
+                continue
+            data = binary._map[section.offset:section.offset + section.size]
+            for end in _GADGET_END.finditer(data):
+                stop = end.start() + len(end[1])
+                for start in range(max(end.start() - depth, 0),
+                    end.start() + 1):
+                    candidates.setdefault(data[start:stop], []) \
+                        .append(section.addr + start)
+
+    # Blob offsets (start, stop) of each candidate
+    spans = []
+    blob = bytearray()
+    for snippet in candidates:
+        spans.append((len(blob), len(blob) + len(snippet)))
+        blob += snippet + _GADGET_PAD
+
+    with tempfile.NamedTemporaryFile() as file:
+        file.write(blob)
+        file.flush()
+        argv = ['objdump', '-D', '-w', '-b', 'binary', '-m', machine,
+            '-M', 'intel', file.name]
+        dump = run(argv, capture_output=True).stdout.decode(errors='replace')
+
+    gadgets = {}
+    decoded = [[] for _ in spans]
+    starts = [x[0] for x in spans]
+    for address, code, text in _GADGET_LINE.findall(dump):
+        address = int(address, 16)
+        i = bisect_left(starts, address + 1) - 1
+        if address < spans[i][1]:
+            decoded[i].append((address, len(code.split()), text))
+
+    for (_, stop), lines, addresses in zip(spans, decoded, candidates.values()):
+        text = _gadget_text(lines, stop)
+        if text is not None:
+            gadgets.setdefault(text, []).extend(addresses)
+    result = {x: tuple(sorted(y)) for x, y in sorted(gadgets.items())}
+
+    if cache:
+        analysis_cache.put(key, result)
+        return dict(result)
+    return result
 
 
 __all__ = [x for x in globals() if x not in __exclude__ and not x.startswith('_')]